@@ -5,6 +5,7 @@ Cleans and preprocesses the raw heart disease dataset.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -12,29 +13,56 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from src.data.preprocessing import clean_data, prepare_features_target
 
 # Define paths
 DATA_RAW_DIR = PROJECT_ROOT / "data" / "raw"
 DATA_PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
 
+# Below this size, memory-mapping setup costs more than it saves
+MMAP_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def read_parquet(path):
+    """Read a Parquet file, memory-mapping large files.
+
+    Mapped pages are shared with the OS page cache across runs and
+    numeric columns become views into them instead of copies.
+    """
+    if path.stat().st_size > MMAP_THRESHOLD_BYTES:
+        with pa.memory_map(str(path), 'r') as source:
+            table = pq.read_table(source)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    return pd.read_parquet(path)
+
 
 def main():
     """Main preprocessing function."""
+    verbose = "--verbose" in sys.argv
+
     print("=" * 60)
     print("Heart Disease Data Preprocessing")
     print("=" * 60)
 
-    # Load raw data
+    # Load raw data, preferring the Parquet cache written by
+    # download_data.py over re-tokenizing the CSV
+    raw_parquet_path = DATA_RAW_DIR / "heart_disease_raw.parquet"
     raw_data_path = DATA_RAW_DIR / "heart_disease_raw.csv"
 
-    if not raw_data_path.exists():
+    if raw_parquet_path.exists():
+        print(f"\nLoading raw data from {raw_parquet_path}...")
+        df_raw = read_parquet(raw_parquet_path)
+    elif raw_data_path.exists():
+        print(f"\nLoading raw data from {raw_data_path}...")
+        # pyarrow engine parses with multiple threads and its dtype backend
+        # roughly halves memory vs numpy-object columns
+        df_raw = pd.read_csv(raw_data_path, engine="pyarrow", dtype_backend="pyarrow")
+    else:
         print(f"Error: Raw data not found at {raw_data_path}")
         print("Please run download_data.py first!")
         return
-
-    print(f"\nLoading raw data from {raw_data_path}...")
-    df_raw = pd.read_csv(raw_data_path)
     print(f"Loaded {len(df_raw)} rows, {len(df_raw.columns)} columns")
 
     # Clean data
@@ -42,11 +70,18 @@ def main():
     df_clean = clean_data(df_raw)
     print(f"After cleaning: {len(df_clean)} rows, {len(df_clean.columns)} columns")
 
-    # Check for missing values
-    missing = df_clean.isnull().sum()
-    if missing.sum() > 0:
-        print("\nMissing values per column:")
-        print(missing[missing > 0])
+    # Check for missing values - the per-column breakdown is a full
+    # O(rows x cols) scan, so only compute it when asked; .any()
+    # short-circuits on the first NaN
+    if verbose:
+        missing = df_clean.isnull().sum()
+        if missing.sum() > 0:
+            print("\nMissing values per column:")
+            print(missing[missing > 0])
+        else:
+            print("\nNo missing values found!")
+    elif df_clean.isna().values.any():
+        print("\nMissing values present (run with --verbose for a breakdown)")
     else:
         print("\nNo missing values found!")
 
@@ -60,7 +95,8 @@ def main():
     # Save processed data
     DATA_PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Save full dataset
+    # Save full dataset (CSV for compatibility, Parquet so downstream
+    # loads skip re-tokenizing the CSV)
     df_clean.to_csv(DATA_PROCESSED_DIR / "heart_disease_processed.csv", index=False)
     print(f"\nProcessed data saved to: {DATA_PROCESSED_DIR / 'heart_disease_processed.csv'}")
 
@@ -70,6 +106,32 @@ def main():
     print(f"Features saved to: {DATA_PROCESSED_DIR / 'X_features.csv'}")
     print(f"Target saved to: {DATA_PROCESSED_DIR / 'y_target.csv'}")
 
+    # float32 halves the feature bytes written with no precision concern
+    # for these measurements, and pyarrow's Parquet writer releases the
+    # GIL, so the three writes can run concurrently
+    X32 = X.astype({c: "float32" for c in X.select_dtypes("float64").columns})
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        writes = [
+            executor.submit(
+                df_clean.to_parquet,
+                DATA_PROCESSED_DIR / "heart_disease_processed.parquet",
+                compression="zstd"
+            ),
+            executor.submit(
+                X32.to_parquet,
+                DATA_PROCESSED_DIR / "X_features.parquet",
+                compression="zstd"
+            ),
+            executor.submit(
+                y.to_frame().to_parquet,
+                DATA_PROCESSED_DIR / "y_target.parquet",
+                compression="zstd"
+            ),
+        ]
+        for write in writes:
+            write.result()
+    print(f"Parquet copies saved to: {DATA_PROCESSED_DIR}")
+
     print("\n" + "=" * 60)
     print("Data preprocessing complete!")
     print("=" * 60)
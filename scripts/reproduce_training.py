@@ -10,7 +10,9 @@ This script ensures full reproducibility by:
 Run this script to reproduce the exact same model training results.
 """
 
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import random
 import numpy as np
@@ -28,15 +30,28 @@ def set_random_seeds(seed=RANDOM_SEED):
     random.seed(seed)
     np.random.seed(seed)
 
-    # Set sklearn random state (will be used in training scripts)
-    import os
-    os.environ['PYTHONHASHSEED'] = str(seed)
-
     print(f"Random seeds set to: {seed}")
 
 
 def main():
     """Main function to reproduce training."""
+    # PYTHONHASHSEED is only read at interpreter startup - assigning it
+    # after Python is already running has no effect. Re-exec once with
+    # the variable set so string hashing is actually deterministic.
+    if os.environ.get('PYTHONHASHSEED') != str(RANDOM_SEED):
+        os.execve(
+            sys.executable,
+            [sys.executable] + sys.argv,
+            {**os.environ, 'PYTHONHASHSEED': str(RANDOM_SEED)}
+        )
+
+    # Kick off the heavy pandas/sklearn import in a worker thread so the
+    # cold import cost overlaps the banner output and seed setup
+    executor = ThreadPoolExecutor(max_workers=1)
+    train_module_future = executor.submit(
+        lambda: __import__('src.models.train', fromlist=['main'])
+    )
+
     print("=" * 60)
     print("Reproduce Training - Full Reproducibility")
     print("=" * 60)
@@ -44,8 +59,8 @@ def main():
     # Set random seeds
     set_random_seeds(RANDOM_SEED)
 
-    # Import after setting seeds
-    from src.models.train import main as train_main
+    train_main = train_module_future.result().main
+    executor.shutdown()
 
     print("\nStarting model training with fixed random seed...")
     print(f"Random seed: {RANDOM_SEED}")
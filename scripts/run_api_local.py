@@ -3,7 +3,9 @@
 Script to run the FastAPI application locally for testing.
 """
 
+import os
 import sys
+import argparse
 from pathlib import Path
 
 # Add project root to path
@@ -13,6 +15,14 @@ sys.path.insert(0, str(PROJECT_ROOT))
 import uvicorn
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the prediction API locally")
+    parser.add_argument(
+        "--prod",
+        action="store_true",
+        help="Serve with uvloop, httptools, and one worker per CPU (no reload)"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("Starting Heart Disease Prediction API")
     print("=" * 60)
@@ -21,12 +31,25 @@ if __name__ == "__main__":
     print("Health Check: http://localhost:8000/health")
     print("\nPress Ctrl+C to stop the server")
     print("=" * 60)
-    
-    uvicorn.run(
-        "src.api.app:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
-    )
 
+    if args.prod:
+        # uvloop + httptools swap the stdlib event loop and HTTP parser
+        # for C implementations; multiple workers scale across cores
+        uvicorn.run(
+            "src.api.app:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=max(2, os.cpu_count() or 1),
+            log_level="warning",
+            access_log=False
+        )
+    else:
+        uvicorn.run(
+            "src.api.app:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            log_level="info"
+        )
@@ -7,10 +7,12 @@ instructions for starting the MLflow UI.
 """
 
 import sys
+import argparse
 import subprocess
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
 
 def check_mlflow():
@@ -29,9 +31,13 @@ def check_mlflow():
 
 
 def check_data():
-    """Check if processed data exists."""
-    data_path = PROJECT_ROOT / "data" / "processed" / "heart_disease_processed.csv"
-    if data_path.exists():
+    """Check if processed data exists (CSV or Parquet)."""
+    processed_dir = PROJECT_ROOT / "data" / "processed"
+    candidates = [
+        processed_dir / "heart_disease_processed.csv",
+        processed_dir / "heart_disease_processed.parquet",
+    ]
+    if any(path.exists() for path in candidates):
         print("✅ Processed data found")
         return True
     else:
@@ -41,25 +47,39 @@ def check_data():
         return False
 
 
-def run_training():
-    """Run MLflow training."""
+def run_training(isolated=False):
+    """Run MLflow training.
+
+    By default the training module is imported and run in-process, which
+    skips a second interpreter startup and the cold pandas/sklearn/mlflow
+    imports. Pass --isolated to fall back to a subprocess.
+    """
     print("\n" + "=" * 60)
     print("Running MLflow Training")
     print("=" * 60)
-    
-    train_script = PROJECT_ROOT / "src" / "models" / "train_with_mlflow.py"
-    
+
+    if isolated:
+        train_script = PROJECT_ROOT / "src" / "models" / "train_with_mlflow.py"
+        try:
+            subprocess.run(
+                [sys.executable, str(train_script)],
+                cwd=str(PROJECT_ROOT),
+                check=True
+            )
+            print("\n✅ Training completed successfully!")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"\n❌ Training failed with error: {e}")
+            return False
+        except Exception as e:
+            print(f"\n❌ Error running training: {e}")
+            return False
+
     try:
-        result = subprocess.run(
-            [sys.executable, str(train_script)],
-            cwd=str(PROJECT_ROOT),
-            check=True
-        )
+        from src.models.train_with_mlflow import main as mlflow_train
+        mlflow_train()
         print("\n✅ Training completed successfully!")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Training failed with error: {e}")
-        return False
     except Exception as e:
         print(f"\n❌ Error running training: {e}")
         return False
@@ -100,17 +120,47 @@ def start_ui():
 
 def main():
     """Main function."""
+    parser = argparse.ArgumentParser(description="MLflow training and UI helper")
+    parser.add_argument(
+        "--action",
+        choices=["train", "ui", "both"],
+        help="Run without the interactive menu (required for CI)"
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run training in a subprocess instead of in-process"
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("MLflow Training and UI Helper")
     print("=" * 60)
-    
+
     # Check prerequisites
     if not check_mlflow():
         sys.exit(1)
-    
+
     if not check_data():
         sys.exit(1)
-    
+
+    # Non-interactive dispatch: explicit --action wins; with no tty
+    # (CI pipelines) default to training instead of blocking on input()
+    action = args.action
+    if action is None and not sys.stdin.isatty():
+        action = "train"
+
+    if action == "train":
+        run_training(isolated=args.isolated)
+        return
+    elif action == "ui":
+        start_ui()
+        return
+    elif action == "both":
+        if run_training(isolated=args.isolated):
+            start_ui()
+        return
+
     # Ask user what to do
     print("\n" + "=" * 60)
     print("What would you like to do?")
@@ -119,15 +169,15 @@ def main():
     print("2. Start MLflow UI only (if training already done)")
     print("3. Run training and start UI")
     print("4. Exit")
-    
+
     choice = input("\nEnter your choice (1-4): ").strip()
-    
+
     if choice == "1":
-        run_training()
+        run_training(isolated=args.isolated)
     elif choice == "2":
         start_ui()
     elif choice == "3":
-        if run_training():
+        if run_training(isolated=args.isolated):
             print("\n" + "=" * 60)
             input("Press Enter to start MLflow UI...")
             start_ui()
@@ -4,9 +4,9 @@ Data preprocessing pipeline for Heart Disease dataset.
 This module provides reusable transformers and preprocessing functions.
 """
 
-import pickle
 from pathlib import Path
 
+import joblib
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
@@ -23,30 +23,42 @@ class HeartDiseasePreprocessor:
         self.scaler = StandardScaler()
         self.imputer = SimpleImputer(strategy='median')
         self.is_fitted = False
-        
+        self._medians = None
+        self._mean = None
+        self._scale = None
+
     def fit(self, X):
         """Fit the preprocessor on training data."""
         # Handle missing values
         X_imputed = self.imputer.fit_transform(X)
-        
+
         # Fit scaler
         self.scaler.fit(X_imputed)
-        
+
+        self._cache_statistics()
         self.is_fitted = True
         return self
-    
+
+    def _cache_statistics(self):
+        """Cache fitted statistics as plain arrays for the fused transform."""
+        self._medians = np.asarray(self.imputer.statistics_, dtype=np.float64)
+        self._mean = np.asarray(self.scaler.mean_, dtype=np.float64)
+        self._scale = np.asarray(self.scaler.scale_, dtype=np.float64)
+
     def transform(self, X):
         """Transform data using fitted preprocessor."""
         if not self.is_fitted:
             raise ValueError("Preprocessor must be fitted before transform!")
-        
-        # Impute missing values
-        X_imputed = self.imputer.transform(X)
-        
-        # Scale features
-        X_scaled = self.scaler.transform(X_imputed)
-        
-        return X_scaled
+
+        # Fused impute + scale in one vectorized pass over a plain float
+        # array. This skips the per-call validation and intermediate
+        # allocations of SimpleImputer.transform + StandardScaler.transform,
+        # which dominate the cost for single-row inference
+        X_arr = np.asarray(X, dtype=np.float64)
+        X_out = np.where(np.isnan(X_arr), self._medians, X_arr)
+        X_out -= self._mean
+        X_out /= self._scale
+        return X_out
     
     def fit_transform(self, X):
         """Fit and transform in one step."""
@@ -54,25 +66,42 @@ class HeartDiseasePreprocessor:
     
     def save(self, filepath):
         """Save preprocessor to disk."""
+        if not self.is_fitted:
+            raise ValueError("Preprocessor must be fitted before saving!")
+        # Only the three fitted statistic arrays are persisted - pickling
+        # the sklearn estimator objects drags in class metadata and
+        # triggers version checks on load for data we never use.
+        # Writing through an open handle keeps the exact filename
+        # (np.savez would append .npz otherwise)
         with open(filepath, 'wb') as f:
-            pickle.dump({
-                'scaler': self.scaler,
-                'imputer': self.imputer,
-                'is_fitted': self.is_fitted
-            }, f)
+            np.savez_compressed(
+                f,
+                medians=self._medians,
+                mean=self._mean,
+                scale=self._scale
+            )
         print(f"Preprocessor saved to {filepath}")
-    
+
     @classmethod
     def load(cls, filepath):
         """Load preprocessor from disk."""
-        with open(filepath, 'rb') as f:
-            data = pickle.load(f)
-        
         preprocessor = cls()
-        preprocessor.scaler = data['scaler']
-        preprocessor.imputer = data['imputer']
-        preprocessor.is_fitted = data['is_fitted']
-        
+        try:
+            with np.load(filepath) as data:
+                preprocessor._medians = data['medians']
+                preprocessor._mean = data['mean']
+                preprocessor._scale = data['scale']
+            preprocessor.is_fitted = True
+        except ValueError:
+            # Legacy artifact from before the npz format: a pickled
+            # dict of the fitted sklearn estimators
+            data = joblib.load(filepath)
+            preprocessor.scaler = data['scaler']
+            preprocessor.imputer = data['imputer']
+            preprocessor.is_fitted = data['is_fitted']
+            if preprocessor.is_fitted:
+                preprocessor._cache_statistics()
+
         return preprocessor
 
 
@@ -87,27 +116,30 @@ def clean_data(df):
         Cleaned dataframe
     """
     df_clean = df.copy()
-    
+
     # Remove source column if present (not needed for modeling)
     if 'source' in df_clean.columns:
         df_clean = df_clean.drop('source', axis=1)
-    
+
     # Convert target to binary (0 = no disease, 1 = disease present)
     # Original: 0 = no disease, 1-4 = disease
     if 'target' in df_clean.columns:
         df_clean['target'] = (df_clean['target'] > 0).astype(int)
-    
-    # Handle missing values - replace with NaN for easier handling
-    df_clean = df_clean.replace([-9.0, -9, '?'], np.nan)
-    
-    # Ensure numeric columns are numeric
-    if 'target' in df_clean.columns:
-        numeric_cols = df_clean.columns.drop('target')
+        feature_cols = df_clean.columns.drop('target')
     else:
-        numeric_cols = df_clean.columns
-    for col in numeric_cols:
-        df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
-    
+        feature_cols = df_clean.columns
+
+    # One vectorized numeric conversion handles both jobs the old code
+    # did in separate passes: '?' placeholders coerce to NaN, and the
+    # resulting float block lets a single numpy mask blank the -9
+    # sentinels in C instead of a Python-dispatched replace
+    features = df_clean[feature_cols].apply(pd.to_numeric, errors='coerce')
+    # copy=True: under pandas copy-on-write to_numpy hands back a
+    # read-only view, which the in-place sentinel mask can't write to
+    arr = features.to_numpy(dtype=np.float64, copy=True)
+    arr[arr == -9] = np.nan
+    df_clean[feature_cols] = arr
+
     return df_clean
 
 
@@ -124,17 +156,28 @@ def prepare_features_target(df):
     """
     if 'target' not in df.columns:
         raise ValueError("Target column 'target' not found in dataframe")
-    
-    X = df.drop('target', axis=1)
+
+    if df.columns[-1] == 'target':
+        # target is the last column in the processed dataset, so a
+        # positional slice shares the underlying block instead of
+        # copying every feature column the way drop() does
+        X = df.iloc[:, :-1]
+    else:
+        X = df.drop('target', axis=1)
     y = df['target']
-    
+
     return X, y
 
 
+# Frozen at module level so hot prediction paths don't allocate a fresh
+# list of names on every call
+FEATURE_NAMES = (
+    "age", "sex", "cp", "trestbps", "chol", "fbs", "restecg",
+    "thalach", "exang", "oldpeak", "slope", "ca", "thal"
+)
+
+
 def get_feature_names():
-    """Get list of feature names."""
-    return [
-        "age", "sex", "cp", "trestbps", "chol", "fbs", "restecg",
-        "thalach", "exang", "oldpeak", "slope", "ca", "thal"
-    ]
+    """Get the tuple of feature names."""
+    return FEATURE_NAMES
 
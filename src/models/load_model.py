@@ -5,9 +5,11 @@ Provides functions to load saved models and make predictions.
 """
 
 import sys
+import fnmatch
+import functools
 from pathlib import Path
-import pickle
 import json
+import joblib
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
@@ -17,12 +19,23 @@ from sklearn.metrics import accuracy_score, roc_auc_score
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
-from src.data.preprocessing import HeartDiseasePreprocessor, get_feature_names, prepare_features_target
+from src.data.preprocessing import HeartDiseasePreprocessor, FEATURE_NAMES, get_feature_names, prepare_features_target
 
 # Define paths
 MODELS_DIR = PROJECT_ROOT / "models"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_summary(path_str, mtime):
+    """Parse a training summary, cached by path and mtime.
+
+    Repeated loads (test suites, model reloads) reuse the parsed dict;
+    the mtime key invalidates the entry when a new summary is written.
+    """
+    with open(path_str, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class ModelLoader:
     """Class to load and use trained models for inference."""
 
@@ -39,18 +52,40 @@ class ModelLoader:
         self.model = None
         self.preprocessor = None
         self.model_info = None
+        self.onnx_session = None
+        self._onnx_input_name = None
+        self._dir_listing = None
+
+    def _scan_model_dir(self):
+        """Classify the models directory in a single listing pass.
+
+        One iterdir replaces the three separate glob scans (model,
+        preprocessor, summary), which each re-stat the directory - slow
+        on networked filesystems.
+        """
+        if self._dir_listing is None:
+            model_pattern = f"{self.model_name}_*.pkl"
+            models, preprocessors, summaries = [], [], []
+            for entry in self.model_dir.iterdir():
+                name = entry.name
+                if fnmatch.fnmatch(name, model_pattern):
+                    models.append(entry)
+                elif fnmatch.fnmatch(name, "preprocessor_*.pkl"):
+                    preprocessors.append(entry)
+                elif fnmatch.fnmatch(name, "training_summary_*.json"):
+                    summaries.append(entry)
+            self._dir_listing = (models, preprocessors, summaries)
+        return self._dir_listing
 
     def load_latest_model(self):
         """Load the most recent model of the specified type."""
-        # Find all model files matching the pattern
-        pattern = f"{self.model_name}_*.pkl"
-        model_files = list(self.model_dir.glob(pattern))
-        
+        model_files, _, _ = self._scan_model_dir()
+
         if not model_files:
             raise FileNotFoundError(
                 f"No {self.model_name} model found in {self.model_dir}"
             )
-        
+
         # Get the latest model file
         latest_model = max(model_files, key=lambda p: p.stat().st_mtime)
         return self.load_model(latest_model)
@@ -69,13 +104,33 @@ class ModelLoader:
         if not model_path.exists():
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
-        # Load model
-        with open(model_path, 'rb') as f:
-            self.model = pickle.load(f)
-        
+        # Load model - mmap_mode maps the numpy tree arrays straight
+        # from disk instead of copying them into each worker's heap
+        self.model = joblib.load(model_path, mmap_mode='r')
+
+        # Prefer the ONNX export when available - onnxruntime scores the
+        # forest in a single fused C++ kernel instead of Python dispatch
+        onnx_path = model_path.with_suffix('.onnx')
+        if onnx_path.exists():
+            try:
+                import onnxruntime
+                self.onnx_session = onnxruntime.InferenceSession(
+                    str(onnx_path), providers=['CPUExecutionProvider']
+                )
+                self._onnx_input_name = self.onnx_session.get_inputs()[0].name
+                print(f"Loaded ONNX session from: {onnx_path}")
+            except ImportError:
+                self.onnx_session = None
+            except Exception as e:
+                # The ONNX sidecar is only an accelerator - a corrupt
+                # or incompatible export must not sink the sklearn
+                # model that already loaded above
+                print(f"Warning: could not load ONNX model {onnx_path}: {e}")
+                print("Falling back to the sklearn model")
+                self.onnx_session = None
+
         # Load preprocessor (look for matching preprocessor file)
-        preprocessor_pattern = "preprocessor_*.pkl"
-        preprocessor_files = list(self.model_dir.glob(preprocessor_pattern))
+        _, preprocessor_files, summary_files = self._scan_model_dir()
 
         if not preprocessor_files:
             raise FileNotFoundError(f"No preprocessor found in {self.model_dir}")
@@ -96,17 +151,16 @@ class ModelLoader:
         self.preprocessor = HeartDiseasePreprocessor.load(matching_preprocessor)
 
         # Load model info if available
-        summary_pattern = "training_summary_*.json"
-        summary_files = list(self.model_dir.glob(summary_pattern))
         if summary_files:
             latest_summary = max(summary_files, key=lambda p: p.stat().st_mtime)
-            with open(latest_summary, 'r', encoding='utf-8') as f:
-                summary = json.load(f)
-                # Try to find model info
-                for model_key in summary.get('models', {}):
-                    if self.model_name in model_key.lower().replace(' ', '_'):
-                        self.model_info = summary['models'][model_key]
-                        break
+            summary = _load_summary(
+                str(latest_summary), latest_summary.stat().st_mtime
+            )
+            # Try to find model info
+            for model_key in summary.get('models', {}):
+                if self.model_name in model_key.lower().replace(' ', '_'):
+                    self.model_info = summary['models'][model_key]
+                    break
 
         print(f"Loaded model from: {model_path}")
         print(f"Loaded preprocessor from: {matching_preprocessor}")
@@ -127,24 +181,39 @@ class ModelLoader:
         if self.model is None or self.preprocessor is None:
             raise ValueError("Model and preprocessor must be loaded first!")
 
-        # Convert to DataFrame if needed
-        if isinstance(X, np.ndarray):
-            feature_names = get_feature_names()
-            if X.shape[1] == len(feature_names):
-                X = pd.DataFrame(X, columns=feature_names)
-            else:
-                X = pd.DataFrame(X)
-        elif isinstance(X, dict):
-            X = pd.DataFrame([X])
+        # The preprocessor works on plain float arrays, so feed it one
+        # directly instead of allocating a DataFrame per request
+        if isinstance(X, dict):
+            X = np.array(
+                [[X.get(name, np.nan) for name in FEATURE_NAMES]],
+                dtype=np.float64
+            )
+        elif isinstance(X, np.ndarray) and X.ndim == 1:
+            X = X.reshape(1, -1)
 
         # Preprocess
         X_scaled = self.preprocessor.transform(X)
 
         # Predict
+        if self.onnx_session is not None:
+            labels, probabilities = self.onnx_session.run(
+                None, {self._onnx_input_name: X_scaled.astype(np.float32)}
+            )
+            return probabilities if return_proba else labels
+
         if return_proba:
             return self.model.predict_proba(X_scaled)
         return self.model.predict(X_scaled)
     
+    def score_batch(self, X):
+        """Preprocess and score a (n_samples, n_features) matrix.
+
+        Single scoring entry point for the API: goes through predict(),
+        which prefers the ONNX session over the sklearn model when one
+        is loaded. Returns the (n_samples, 2) probability matrix.
+        """
+        return self.predict(X, return_proba=True)
+
     def predict_single(self, **kwargs):
         """
         Make prediction for a single sample using keyword arguments.
@@ -155,16 +224,18 @@ class ModelLoader:
         Returns:
             Dictionary with prediction, probability, and confidence
         """
-        # Get feature names
-        feature_names = get_feature_names()
-        
-        # Create DataFrame from kwargs
-        sample = pd.DataFrame([{name: kwargs.get(name, np.nan) for name in feature_names}])
-        
-        # Predict
-        prediction = self.predict(sample)[0]
+        # Build a (1, n_features) float array directly - no pandas
+        # BlockManager or dtype inference on the hot path
+        sample = np.array(
+            [[kwargs.get(name, np.nan) for name in FEATURE_NAMES]],
+            dtype=np.float64
+        )
+
+        # One predict_proba pass yields both the label and the
+        # probabilities - no second preprocessing + forest traversal
         probabilities = self.predict(sample, return_proba=True)[0]
-        
+        prediction = int(probabilities.argmax())
+
         return {
             'prediction': int(prediction),
             'prediction_label': 'Disease Present' if prediction == 1 else 'No Disease',
@@ -173,13 +244,17 @@ class ModelLoader:
         }
 
 
+@functools.lru_cache(maxsize=1)
 def load_best_model(model_dir=None):
     """
     Load the best model (Random Forest by default).
-    
+
+    Memoized so repeated calls (uvicorn reloads, test suites) share one
+    loaded model instead of re-reading the models directory.
+
     Args:
         model_dir: Directory containing models
-        
+
     Returns:
         ModelLoader instance
     """
@@ -201,8 +276,9 @@ def _evaluate_on_test_data(loader):
         X, y, test_size=0.2, random_state=42, stratify=y
     )
 
-    predictions = loader.predict(X_test)
-    probabilities = loader.predict(X_test, return_proba=True)[:, 1]
+    proba = loader.predict(X_test, return_proba=True)
+    predictions = proba.argmax(axis=1)
+    probabilities = proba[:, 1]
 
     accuracy = accuracy_score(y_test, predictions)
     roc_auc = roc_auc_score(y_test, probabilities)
@@ -14,8 +14,12 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from src.data.preprocessing import HeartDiseasePreprocessor
 
-@pytest.fixture
+
+# Session scope: these frames are read-only inputs, so one build is
+# shared by every test instead of re-running dtype inference per test
+@pytest.fixture(scope="session")
 def sample_heart_disease_data():
     """Create sample heart disease dataset for testing."""
     return pd.DataFrame({
@@ -36,7 +40,17 @@ def sample_heart_disease_data():
     })
 
 
-@pytest.fixture
+# Fitted once per session for tests that only exercise transform;
+# tests validating fit semantics still construct their own instance
+@pytest.fixture(scope="session")
+def fitted_preprocessor(sample_heart_disease_data):
+    """Preprocessor fitted on the sample dataset's feature columns."""
+    preprocessor = HeartDiseasePreprocessor()
+    preprocessor.fit(sample_heart_disease_data.drop(columns=['target']))
+    return preprocessor
+
+
+@pytest.fixture(scope="session")
 def sample_features_only():
     """Create sample features without target."""
     return pd.DataFrame({
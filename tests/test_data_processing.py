@@ -83,34 +83,20 @@ class TestHeartDiseasePreprocessor:
         assert not np.isnan(X_transformed).any()
         assert X_transformed.shape == X.shape
     
-    def test_preprocessor_save_and_load(self, tmp_path):
+    def test_preprocessor_save_and_load(self, fitted_preprocessor, sample_features_only, tmp_path):
         """Test preprocessor can be saved and loaded."""
-        preprocessor = HeartDiseasePreprocessor()
-        X = pd.DataFrame({
-            'age': [63, 67, 37],
-            'sex': [1, 1, 1],
-            'cp': [1, 4, 3]
-        })
-        
-        preprocessor.fit(X)
-        
         # Save
         save_path = tmp_path / "preprocessor.pkl"
-        preprocessor.save(save_path)
+        fitted_preprocessor.save(save_path)
         assert save_path.exists()
-        
+
         # Load
         loaded_preprocessor = HeartDiseasePreprocessor.load(save_path)
         assert loaded_preprocessor.is_fitted == True
-        
+
         # Test loaded preprocessor works
-        X_test = pd.DataFrame({
-            'age': [50, 60],
-            'sex': [1, 0],
-            'cp': [2, 3]
-        })
-        result = loaded_preprocessor.transform(X_test)
-        assert result.shape == X_test.shape
+        result = loaded_preprocessor.transform(sample_features_only)
+        assert result.shape == sample_features_only.shape
 
 
 class TestDataCleaning:
@@ -180,7 +166,7 @@ class TestDataCleaning:
     def test_get_feature_names(self):
         """Test get_feature_names returns correct list."""
         feature_names = get_feature_names()
-        assert isinstance(feature_names, list)
+        assert isinstance(feature_names, tuple)
         assert len(feature_names) == 13
         assert 'age' in feature_names
         assert 'sex' in feature_names
@@ -62,11 +62,6 @@ except ImportError as e:
     print(f"{'='*60}\n")
     raise
 
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-
-
 class TestModelLoader:
     """Test cases for ModelLoader class."""
     
@@ -102,12 +97,18 @@ class TestModelLoader:
         loader = ModelLoader(model_name="test")
         
         # Create mock model and preprocessor
+        # int8/float32 literals: the smallest dtypes that hold these
+        # constants, matching the pipeline's narrow-dtype policy
         mock_model = MagicMock()
-        mock_model.predict.return_value = np.array([1])
-        mock_model.predict_proba.return_value = np.array([[0.3, 0.7]])
-        
+        mock_model.predict.return_value = np.array([1], dtype=np.int8)
+        mock_model.predict_proba.return_value = np.array(
+            [[0.3, 0.7]], dtype=np.float32
+        )
+
         mock_preprocessor = MagicMock()
-        mock_preprocessor.transform.return_value = np.array([[1, 2, 3]])
+        mock_preprocessor.transform.return_value = np.array(
+            [[1, 2, 3]], dtype=np.float32
+        )
         
         loader.model = mock_model
         loader.preprocessor = mock_preprocessor
@@ -134,15 +135,17 @@ class TestModelLoader:
         
         # Create mock model and preprocessor
         mock_model = MagicMock()
-        mock_model.predict.return_value = np.array([0, 1, 0, 1, 0][:n_samples])
+        mock_model.predict.return_value = np.array(
+            [0, 1, 0, 1, 0][:n_samples], dtype=np.int8
+        )
         mock_model.predict_proba.return_value = np.array([
             [0.8, 0.2],
             [0.3, 0.7],
             [0.9, 0.1],
             [0.4, 0.6],
             [0.85, 0.15]
-        ])[:n_samples]
-        
+        ], dtype=np.float32)[:n_samples]
+
         mock_preprocessor = MagicMock()
         mock_preprocessor.transform.return_value = np.array([
             [1, 2, 3],
@@ -150,7 +153,7 @@ class TestModelLoader:
             [7, 8, 9],
             [10, 11, 12],
             [13, 14, 15]
-        ])[:n_samples]
+        ], dtype=np.float32)[:n_samples]
         
         loader.model = mock_model
         loader.preprocessor = mock_preprocessor
@@ -164,98 +167,107 @@ class TestModelLoader:
         assert probabilities.shape[1] == 2  # Binary classification
 
 
+# Module level rather than instance methods: pytest deprecates
+# class-scoped fixtures defined as instance methods
+@pytest.fixture(scope="module")
+def sample_training_data():
+    """Create sample data for training."""
+    rng = np.random.default_rng(42)
+    n_samples = 100
+
+    # One broadcast integers() draw fills all eleven integer
+    # columns instead of a separate RNG call and allocation each
+    int_cols = ('age', 'sex', 'cp', 'trestbps', 'chol', 'fbs',
+                'restecg', 'thalach', 'exang', 'slope', 'ca')
+    lows = (30, 0, 1, 90, 100, 0, 0, 70, 0, 1, 0)
+    highs = (80, 2, 5, 200, 400, 2, 3, 200, 2, 4, 4)
+    ints = rng.integers(lows, highs, size=(n_samples, len(int_cols)))
+
+    columns = dict(zip(int_cols, ints.T))
+    columns['oldpeak'] = rng.uniform(0, 6, n_samples)
+    columns['thal'] = rng.choice([3, 6, 7], n_samples)
+
+    X = pd.DataFrame({
+        col: columns[col]
+        for col in ('age', 'sex', 'cp', 'trestbps', 'chol', 'fbs',
+                    'restecg', 'thalach', 'exang', 'oldpeak',
+                    'slope', 'ca', 'thal')
+    })
+    y = pd.Series(rng.integers(0, 2, n_samples))
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def trained_lr(sample_training_data):
+    """Fit one logistic regression shared by the LR test trio."""
+    # Imported here so collection and loader-only test runs skip
+    # sklearn's linear_model extension load
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = sample_training_data
+
+    preprocessor = HeartDiseasePreprocessor()
+    X_scaled = preprocessor.fit_transform(X)
+
+    model = LogisticRegression(random_state=42, max_iter=1000)
+    model.fit(X_scaled, y)
+    return model, X_scaled, y
+
+
 class TestModelTraining:
     """Test cases for model training functionality."""
-    
-    @pytest.fixture
-    def sample_training_data(self):
-        """Create sample data for training."""
-        np.random.seed(42)
-        n_samples = 100
-        X = pd.DataFrame({
-            'age': np.random.randint(30, 80, n_samples),
-            'sex': np.random.randint(0, 2, n_samples),
-            'cp': np.random.randint(1, 5, n_samples),
-            'trestbps': np.random.randint(90, 200, n_samples),
-            'chol': np.random.randint(100, 400, n_samples),
-            'fbs': np.random.randint(0, 2, n_samples),
-            'restecg': np.random.randint(0, 3, n_samples),
-            'thalach': np.random.randint(70, 200, n_samples),
-            'exang': np.random.randint(0, 2, n_samples),
-            'oldpeak': np.random.uniform(0, 6, n_samples),
-            'slope': np.random.randint(1, 4, n_samples),
-            'ca': np.random.randint(0, 4, n_samples),
-            'thal': np.random.choice([3, 6, 7], n_samples)
-        })
-        y = pd.Series(np.random.randint(0, 2, n_samples))
-        return X, y
-    
-    def test_logistic_regression_training(self, sample_training_data):
+
+    def test_logistic_regression_training(self, trained_lr):
         """Test Logistic Regression can be trained."""
-        X, y = sample_training_data
-        
-        # Preprocess
-        preprocessor = HeartDiseasePreprocessor()
-        X_scaled = preprocessor.fit_transform(X)
-        
-        # Train model
-        model = LogisticRegression(random_state=42, max_iter=1000)
-        model.fit(X_scaled, y)
-        
+        model, X_scaled, y = trained_lr
+
         # Make predictions
         predictions = model.predict(X_scaled)
         probabilities = model.predict_proba(X_scaled)
-        
+
         assert len(predictions) == len(y)
         assert probabilities.shape == (len(y), 2)
         assert model.score(X_scaled, y) > 0  # Should have some accuracy
-    
+
     def test_random_forest_training(self, sample_training_data):
         """Test Random Forest can be trained."""
+        from sklearn.ensemble import RandomForestClassifier
+
         X, y = sample_training_data
-        
+
         # Preprocess
         preprocessor = HeartDiseasePreprocessor()
         X_scaled = preprocessor.fit_transform(X)
-        
-        # Train model
-        model = RandomForestClassifier(n_estimators=10, random_state=42)
+
+        # Train model - sqrt feature sampling keeps each of the 10
+        # small trees cheap to build
+        model = RandomForestClassifier(
+            n_estimators=10, max_features='sqrt', random_state=42
+        )
         model.fit(X_scaled, y)
-        
+
         # Make predictions
         predictions = model.predict(X_scaled)
         probabilities = model.predict_proba(X_scaled)
-        
+
         assert len(predictions) == len(y)
         assert probabilities.shape == (len(y), 2)
         assert model.score(X_scaled, y) > 0  # Should have some accuracy
-    
-    def test_model_predictions_are_binary(self, sample_training_data):
+
+    def test_model_predictions_are_binary(self, trained_lr):
         """Test model predictions are binary (0 or 1)."""
-        X, y = sample_training_data
-        
-        preprocessor = HeartDiseasePreprocessor()
-        X_scaled = preprocessor.fit_transform(X)
-        
-        model = LogisticRegression(random_state=42, max_iter=1000)
-        model.fit(X_scaled, y)
-        
+        model, X_scaled, _ = trained_lr
+
         predictions = model.predict(X_scaled)
-        
+
         assert set(predictions).issubset({0, 1})
-    
-    def test_model_probabilities_sum_to_one(self, sample_training_data):
+
+    def test_model_probabilities_sum_to_one(self, trained_lr):
         """Test model probabilities sum to 1."""
-        X, y = sample_training_data
-        
-        preprocessor = HeartDiseasePreprocessor()
-        X_scaled = preprocessor.fit_transform(X)
-        
-        model = LogisticRegression(random_state=42, max_iter=1000)
-        model.fit(X_scaled, y)
-        
+        model, X_scaled, _ = trained_lr
+
         probabilities = model.predict_proba(X_scaled)
-        
+
         # Each row should sum to approximately 1
         assert np.allclose(probabilities.sum(axis=1), 1.0)
 